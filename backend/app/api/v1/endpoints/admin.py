@@ -127,10 +127,7 @@ async def retry_model(
     try:
         # Reset circuit breaker for the model
         if model_name in model_router.circuit_breakers:
-            circuit_breaker = model_router.circuit_breakers[model_name]
-            circuit_breaker.failure_count = 0
-            circuit_breaker.state = "CLOSED"
-            circuit_breaker.last_failure_time = None
+            model_router.circuit_breakers[model_name].reset()
 
             return {"message": f"Model {model_name} reset successfully"}
         else:
@@ -1,12 +1,15 @@
 """
 AI processing endpoints.
 """
+import asyncio
 from typing import Any, List
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel import Session
 
 from app.core.auth import get_current_user
+from app.core.config import settings
 from app.core.database import get_session
+from app.core.rate_limit import enforce_rate_limit
 from app.models.upload import Document
 from app.schemas.upload import (
     SummaryRequest,
@@ -23,9 +26,28 @@ from app.services.model_router import model_router
 router = APIRouter()
 
 
+async def call_model_with_timeout(**kwargs):
+    """
+    model_router.call_model bounded by LLM_REQUEST_TIMEOUT_SECONDS.
+
+    The limit covers the whole fallback chain and is read on every call.
+    Raises a 504 HTTPException when it runs out.
+    """
+    try:
+        return await asyncio.wait_for(
+            model_router.call_model(**kwargs),
+            timeout=settings.LLM_REQUEST_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="AI model request timed out"
+        ) from None
+
+
 SUMMARIZE_PROMPT = """
 Task: Summarize the following text for an undergraduate student in simple English.
-Output format: JSON { "title": "...", "summary": "...", "key_points": ["...","..."], "recommended_reading": ["..."] }
+Output format: JSON {{ "title": "...", "summary": "...", "key_points": ["...","..."], "recommended_reading": ["..."] }}
 Text: {text}
 """
 
@@ -40,7 +62,11 @@ Content: {text}
 """
 
 
-@router.post("/summarize", response_model=SummaryResponse)
+@router.post(
+    "/summarize",
+    response_model=SummaryResponse,
+    dependencies=[Depends(enforce_rate_limit)]
+)
 async def summarize_text(
     request: SummaryRequest,
     current_user: Any = Depends(get_current_user),
@@ -87,7 +113,7 @@ async def summarize_text(
     # Generate summary using AI
     try:
         prompt = SUMMARIZE_PROMPT.format(text=text_content[:4000])  # Limit text length
-        response_text, model_used = await model_router.call_model(
+        response_text, model_used = await call_model_with_timeout(
             prompt=prompt,
             task_type="summarize",
             max_tokens=request.max_length
@@ -104,6 +130,8 @@ async def summarize_text(
 
         return SummaryResponse(**summary_data)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -111,7 +139,11 @@ async def summarize_text(
         )
 
 
-@router.post("/flashcards", response_model=FlashcardGenerationResponse)
+@router.post(
+    "/flashcards",
+    response_model=FlashcardGenerationResponse,
+    dependencies=[Depends(enforce_rate_limit)]
+)
 async def generate_flashcards(
     request: FlashcardRequest,
     current_user: Any = Depends(get_current_user),
@@ -165,7 +197,7 @@ async def generate_flashcards(
             upload_id=upload_id or "text"
         )
 
-        response_text, model_used = await model_router.call_model(
+        response_text, model_used = await call_model_with_timeout(
             prompt=prompt,
             task_type="flashcard"
         )
@@ -192,6 +224,8 @@ async def generate_flashcards(
 
         return FlashcardGenerationResponse(flashcards=flashcards)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -199,7 +233,11 @@ async def generate_flashcards(
         )
 
 
-@router.post("/quiz", response_model=QuizGenerationResponse)
+@router.post(
+    "/quiz",
+    response_model=QuizGenerationResponse,
+    dependencies=[Depends(enforce_rate_limit)]
+)
 async def generate_quiz(
     request: QuizGenerationRequest,
     current_user: Any = Depends(get_current_user),
@@ -250,7 +288,7 @@ async def generate_quiz(
             text=text_content[:4000]  # Limit text length
         )
 
-        response_text, model_used = await model_router.call_model(
+        response_text, model_used = await call_model_with_timeout(
             prompt=prompt,
             task_type="quiz"
         )
@@ -283,6 +321,8 @@ async def generate_quiz(
             questions=questions
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -5,21 +5,36 @@ import os
 import shutil
 from pathlib import Path
 from typing import Any
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile, status
 from sqlmodel import Session
 
 from app.core.auth import get_current_user
 from app.core.config import settings
 from app.core.database import get_session
+from app.core.logging import get_logger
 from app.models.upload import Upload
 from app.schemas.upload import UploadResponse
 
 
 router = APIRouter()
+logger = get_logger(__name__)
+
+
+def queue_document_pipeline(upload_id: int, user_id: int):
+    """Queue text extraction followed by AI summarization for an upload."""
+    try:
+        from app.tasks import enqueue_document_pipeline
+
+        enqueue_document_pipeline(upload_id, user_id)
+    except Exception as e:
+        # Background processing is optional (e.g. Redis not running);
+        # the upload stays in "pending" status
+        logger.warning(f"Could not queue processing for upload {upload_id}: {e}")
 
 
 @router.post("/", response_model=UploadResponse)
 async def upload_file(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: Any = Depends(get_current_user),
     session: Session = Depends(get_session)
@@ -89,6 +104,10 @@ async def upload_file(
     session.commit()
     session.refresh(upload_record)
 
+    # Publishing to the broker blocks, so it runs in the threadpool after
+    # the response is sent rather than on the event loop
+    background_tasks.add_task(queue_document_pipeline, upload_record.id, current_user.id)
+
     return UploadResponse.from_orm(upload_record)
 
 
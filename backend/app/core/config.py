@@ -77,6 +77,7 @@ class Settings(BaseSettings):
     CIRCUIT_BREAKER_WINDOW_MINUTES: int = 10
     CIRCUIT_BREAKER_SKIP_MINUTES: int = 30
     LLM_TIMEOUT_SECONDS: int = 15
+    LLM_REQUEST_TIMEOUT_SECONDS: int = 60  # whole request, including fallbacks
     LLM_MAX_RETRIES: int = 3
     LLM_BACKOFF_FACTOR: int = 2
 
@@ -6,11 +6,19 @@ from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
 
+# Batch multi-row INSERTs into pages of this many rows
+engine_options = {"insertmanyvalues_page_size": 1000}
+
+if settings.DATABASE_URL.startswith(("postgresql://", "postgresql+psycopg2://")):
+    # Also batch executemany() UPDATE/DELETE statements on psycopg2
+    engine_options["executemany_mode"] = "values_plus_batch"
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
+    **engine_options,
 )
 
 
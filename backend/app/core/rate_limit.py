@@ -0,0 +1,79 @@
+"""
+In-memory rate limiting for API endpoints.
+"""
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict
+
+from fastapi import Depends, HTTPException, status
+
+from app.core.auth import get_current_user
+from app.core.config import settings
+from app.models.user import User
+
+
+class RateLimiter:
+    """Sliding-window limiter allowing `max_requests` per `window` seconds per key."""
+
+    def __init__(self, max_requests: int, window: float):
+        self.max_requests = max_requests
+        self.window = window
+        self._hits: Dict[str, Deque[float]] = {}
+        self._last_sweep = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _prune(self, key: str, now: float) -> Deque[float]:
+        """Drop `key`'s hits older than the window; forget the key once none are left."""
+        hits = self._hits[key]
+        while hits and now - hits[0] >= self.window:
+            hits.popleft()
+        if not hits:
+            del self._hits[key]
+        return hits
+
+    def hit(self, key: str) -> bool:
+        """Record a request for `key`. Returns False if it exceeds the limit."""
+        now = time.monotonic()
+        with self._lock:
+            # Once per window, forget keys that have gone quiet
+            if now - self._last_sweep >= self.window:
+                for stale_key in list(self._hits):
+                    self._prune(stale_key, now)
+                self._last_sweep = now
+
+            hits = self._prune(key, now) if key in self._hits else deque()
+            if len(hits) >= self.max_requests:
+                return False
+            hits.append(now)
+            self._hits[key] = hits
+            return True
+
+    def reset(self):
+        """Forget all recorded requests."""
+        with self._lock:
+            self._hits.clear()
+
+
+# Global rate limiter instance
+rate_limiter = RateLimiter(
+    max_requests=settings.RATE_LIMIT_REQUESTS,
+    window=settings.RATE_LIMIT_WINDOW_MINUTES * 60
+)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Dependency returning the active limiter (overridable in tests)."""
+    return rate_limiter
+
+
+async def enforce_rate_limit(
+    current_user: User = Depends(get_current_user),
+    limiter: RateLimiter = Depends(get_rate_limiter)
+) -> None:
+    """Reject the request with 429 once the user exceeds the rate limit."""
+    if not limiter.hit(f"user:{current_user.id}"):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded"
+        )
@@ -1,9 +1,10 @@
 """
 Security utilities for authentication and authorization.
 """
+import time
 from datetime import datetime, timedelta
 from typing import Any, Union, Optional
-from jose import jwt
+from jose import jwk, jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
 
@@ -14,6 +15,11 @@ from app.core.config import settings
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+# JWT key object, built once instead of on every encode/decode. HMAC is
+# symmetric, so the same key both signs and verifies.
+_SIGNING_KEY = jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
+
+
 class Token(BaseModel):
     """JWT token model."""
     access_token: str
@@ -31,17 +37,16 @@ def create_access_token(
     expires_delta: Optional[timedelta] = None
 ) -> str:
     """Create JWT access token."""
+    # "exp" is stored as epoch seconds, so skip the datetime round trip
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time()) + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = int(time.time()) + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
     to_encode = {"exp": expire, "sub": str(subject)}
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
+        _SIGNING_KEY,
         algorithm=settings.ALGORITHM
     )
     return encoded_jwt
@@ -49,11 +54,11 @@ def create_access_token(
 
 def create_refresh_token(subject: Union[str, Any]) -> str:
     """Create JWT refresh token."""
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = int(time.time()) + settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
     to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
     encoded_jwt = jwt.encode(
         to_encode,
-        settings.SECRET_KEY,
+        _SIGNING_KEY,
         algorithm=settings.ALGORITHM
     )
     return encoded_jwt
@@ -74,7 +79,7 @@ def decode_token(token: str) -> Optional[TokenData]:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
+            _SIGNING_KEY,
             algorithms=[settings.ALGORITHM]
         )
         email: str = payload.get("sub")
@@ -93,7 +98,7 @@ def is_token_expired(token: str) -> bool:
     try:
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
+            _SIGNING_KEY,
             algorithms=[settings.ALGORITHM],
             options={"verify_exp": False}
         )
@@ -16,6 +16,7 @@ from app.api.v1.api import api_router
 from app.core.logging import setup_logging
 from app.core.auth import get_current_user, get_optional_current_user
 from app.models.user import User
+from app.services.model_router import model_router
 
 
 @asynccontextmanager
@@ -26,7 +27,7 @@ async def lifespan(app: FastAPI):
     create_db_and_tables()
     yield
     # Shutdown
-    # Add cleanup logic here if needed
+    await model_router.close()
 
 
 def create_application() -> FastAPI:
@@ -3,7 +3,7 @@ from .user import User, UserProfile
 from .upload import Upload, Document
 from .study import Flashcard, Quiz, Deadline
 from .networking import Interaction, Match, Opportunity
-from .system import Log, ModelStatus
+from .system import Log, ModelStatus, PromptCache
 
 # Import all models for Alembic
 __all__ = [
@@ -19,4 +19,5 @@ __all__ = [
     "Opportunity",
     "Log",
     "ModelStatus",
+    "PromptCache",
 ]
\ No newline at end of file
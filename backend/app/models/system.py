@@ -41,4 +41,17 @@ class ModelStatus(SQLModel, table=True):
     average_response_time: Optional[float] = None  # in seconds
     last_success_at: Optional[datetime] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
\ No newline at end of file
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class PromptCache(SQLModel, table=True):
+    """Cached AI responses keyed by task type and source content hash."""
+
+    __tablename__ = "prompt_cache"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    task_type: str = Field(index=True)
+    content_hash: str = Field(index=True)  # sha256 of the (truncated) source text
+    model: str
+    response: str
+    created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -36,6 +36,7 @@ class Document(SQLModel, table=True):
     title: str
     content_summary: str
     full_content: Optional[str] = None
+    content_sha256: Optional[str] = Field(default=None, index=True)  # hash of the first 4000 chars
     embeddings: Optional[str] = None  # JSON string of embeddings
     word_count: Optional[int] = None
     page_count: Optional[int] = None
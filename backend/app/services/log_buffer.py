@@ -0,0 +1,132 @@
+"""
+Buffered writer for application Log records.
+
+Background tasks hand their log entries to a queue instead of committing
+each one; a daemon thread drains the queue and writes the rows in batches.
+"""
+import json
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from app.core.database import engine
+from app.models.system import Log
+
+
+logger = logging.getLogger(__name__)
+
+
+class LogBuffer:
+    """Queue of pending Log rows flushed to the database in batches."""
+
+    def __init__(self, flush_interval: float = 1.0, batch_size: int = 100):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the background writer thread if it is not running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name="log-buffer-writer",
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop the writer thread and flush anything still queued."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._stop_event.set()
+            thread.join(timeout=self.flush_interval * 5)
+        self.flush()
+
+    def put(
+        self,
+        level: str,
+        message: str,
+        module: Optional[str] = None,
+        function: Optional[str] = None,
+        user_id: Optional[int] = None,
+        context: Optional[Dict[str, Any]] = None
+    ):
+        """Queue a log entry for the next batch write."""
+        self._queue.put({
+            "level": level,
+            "message": message,
+            "module": module,
+            "function": function,
+            "user_id": user_id,
+            "context": json.dumps(context or {}),
+            "created_at": datetime.utcnow(),
+        })
+        self.start()
+
+    def flush(self) -> int:
+        """Write every queued entry immediately. Returns the number written."""
+        written = 0
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                return written
+            self._write(batch)
+            written += len(batch)
+
+    def _run(self):
+        """Writer loop: flush every `flush_interval` seconds or `batch_size` rows."""
+        while not self._stop_event.is_set():
+            batch = self._collect_batch()
+            if batch:
+                self._write(batch)
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        """Block until a batch is full or the flush interval has elapsed."""
+        batch: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        """Take up to `limit` entries without blocking."""
+        batch: List[Dict[str, Any]] = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        """Insert a batch of log rows in a single statement."""
+        try:
+            with Session(engine) as session:
+                session.execute(insert(Log), batch)
+                session.commit()
+        except Exception:
+            logger.exception("Failed to write %d buffered log entries", len(batch))
+
+
+# Global log buffer instance
+log_buffer = LogBuffer()
@@ -2,18 +2,36 @@
 AI Model Router with multi-provider support and circuit breaker logic.
 """
 import asyncio
+import random
+import threading
 import time
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
+from prometheus_client import Counter
 from pydantic import BaseModel
 
 from app.core.config import settings
+from app.core.logging import get_logger
 from app.models.system import ModelStatus
 
 
+logger = get_logger(__name__)
+
+# Fraction of successful model calls that are written to the log.
+# Failures are always logged; the counters below track every call.
+SUCCESS_LOG_SAMPLE_RATE = 0.01
+
+MODEL_CALL_SUCCESS = Counter(
+    "model_call_success", "Successful AI model calls", ["model"]
+)
+MODEL_CALL_FAILURE = Counter(
+    "model_call_failure", "Failed AI model calls", ["model"]
+)
+
+
 class ModelProvider(Enum):
     """Available model providers."""
     OPENROUTER = "openrouter"
@@ -31,6 +49,13 @@ class ModelConfig(BaseModel):
     temperature: float = 0.7
 
 
+class CircuitState(IntEnum):
+    """Circuit breaker states."""
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
 class CircuitBreaker:
     """Circuit breaker for model providers."""
 
@@ -44,41 +69,66 @@ class CircuitBreaker:
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
         self.failure_count = 0
-        self.last_failure_time: Optional[datetime] = None
-        self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        self.last_failure_time: Optional[float] = None  # time.monotonic() value
+        self._state = CircuitState.CLOSED
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current circuit state."""
+        return self._state
 
     def can_execute(self) -> bool:
         """Check if the circuit breaker allows execution."""
-        if self.state == "CLOSED":
+        state = self._state
+        if state == CircuitState.CLOSED or state == CircuitState.HALF_OPEN:
             return True
-        elif self.state == "OPEN":
-            if self._should_attempt_reset():
-                self.state = "HALF_OPEN"
-                return True
+
+        # Open and still cooling down: skip without taking the lock
+        if not self._should_attempt_reset():
             return False
-        elif self.state == "HALF_OPEN":
-            return True
-        return False
+
+        with self._lock:
+            if self._state == CircuitState.OPEN and self._should_attempt_reset():
+                self._state = CircuitState.HALF_OPEN
+            return self._state != CircuitState.OPEN
 
     def record_success(self):
         """Record a successful execution."""
-        self.failure_count = 0
-        self.state = "CLOSED"
+        with self._lock:
+            self.failure_count = 0
+            self._state = CircuitState.CLOSED
 
     def record_failure(self):
         """Record a failed execution."""
-        self.failure_count += 1
-        self.last_failure_time = datetime.utcnow()
+        now = time.monotonic()
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = now
+
+            if self.failure_count >= self.failure_threshold:
+                self._state = CircuitState.OPEN
 
-        if self.failure_count >= self.failure_threshold:
-            self.state = "OPEN"
+    def reset(self):
+        """Close the circuit and clear the failure history."""
+        with self._lock:
+            self.failure_count = 0
+            self.last_failure_time = None
+            self._state = CircuitState.CLOSED
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt a reset."""
         if self.last_failure_time is None:
             return True
 
-        return (datetime.utcnow() - self.last_failure_time) > timedelta(seconds=self.recovery_timeout)
+        return (time.monotonic() - self.last_failure_time) > self.recovery_timeout
+
+    def last_failure_datetime(self) -> Optional[datetime]:
+        """Wall-clock (UTC) time of the last failure, for reporting."""
+        if self.last_failure_time is None:
+            return None
+        elapsed = time.monotonic() - self.last_failure_time
+        return datetime.utcnow() - timedelta(seconds=elapsed)
 
 
 class ModelRouter:
@@ -86,8 +136,31 @@ class ModelRouter:
 
     def __init__(self):
         self.models = self._initialize_models()
+        self._models_by_name: Dict[str, ModelConfig] = {m.name: m for m in self.models}
+        self._default_priority: List[str] = [
+            m.name for m in sorted(self.models, key=lambda x: x.priority)
+        ]
         self.circuit_breakers = self._initialize_circuit_breakers()
-        self.client = httpx.AsyncClient(timeout=httpx.Timeout(settings.LLM_TIMEOUT_SECONDS))
+        # Everything call_model needs per candidate, in default priority order
+        self._default_route = self._build_route(self._default_priority)
+        self.client = self._create_client()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client shared by all provider calls."""
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.LLM_TIMEOUT_SECONDS),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+
+    def reset_client(self):
+        """
+        Replace the HTTP client with a fresh one.
+
+        The AsyncClient's connection pool is bound to the event loop it is
+        first used on, so worker processes call this after installing their
+        own long-lived loop.
+        """
+        self.client = self._create_client()
 
     def _initialize_models(self) -> List[ModelConfig]:
         """Initialize available models."""
@@ -146,6 +219,17 @@ class ModelRouter:
             ),
         ]
 
+    def _build_route(
+        self,
+        priority_list: List[str]
+    ) -> List[Tuple[str, ModelConfig, CircuitBreaker]]:
+        """Resolve model names to (name, config, circuit breaker), skipping unknown names."""
+        return [
+            (name, self._models_by_name[name], self.circuit_breakers[name])
+            for name in priority_list
+            if name in self._models_by_name
+        ]
+
     def _initialize_circuit_breakers(self) -> Dict[str, CircuitBreaker]:
         """Initialize circuit breakers for each model."""
         return {
@@ -176,37 +260,42 @@ class ModelRouter:
             Tuple of (response_text, model_used)
         """
         if priority_list is None:
-            priority_list = [model.name for model in sorted(self.models, key=lambda x: x.priority)]
-
-        for model_name in priority_list:
-            model = next((m for m in self.models if m.name == model_name), None)
-            if not model:
-                continue
-
-            circuit_breaker = self.circuit_breakers[model_name]
+            route = self._default_route
+        else:
+            route = self._build_route(priority_list)
 
+        for model_name, model, circuit_breaker in route:
             if not circuit_breaker.can_execute():
                 continue
 
             try:
-                start_time = time.time()
+                start_time = time.monotonic()
                 response = await self._call_single_model(model, prompt, **kwargs)
-                response_time = time.time() - start_time
+                response_time = time.monotonic() - start_time
 
                 # Record success
                 circuit_breaker.record_success()
+                MODEL_CALL_SUCCESS.labels(model=model_name).inc()
 
-                # Log success
-                print(f"Model {model_name} succeeded in {response_time:.2f}s")
+                # Log a sample of successes to keep logging off the hot path
+                if random.random() < SUCCESS_LOG_SAMPLE_RATE:
+                    logger.info(
+                        "Model call succeeded",
+                        extra={"model": model_name, "latency_ms": response_time * 1000}
+                    )
 
                 return response, model_name
 
             except Exception as e:
                 # Record failure
                 circuit_breaker.record_failure()
+                MODEL_CALL_FAILURE.labels(model=model_name).inc()
 
                 # Log failure
-                print(f"Model {model_name} failed: {str(e)}")
+                logger.warning(
+                    "Model call failed",
+                    extra={"model": model_name, "error": str(e)}
+                )
 
                 # Continue to next model
                 continue
@@ -304,11 +393,12 @@ class ModelRouter:
         status = {}
         for model in self.models:
             circuit_breaker = self.circuit_breakers[model.name]
+            last_failure = circuit_breaker.last_failure_datetime()
             status[model.name] = {
                 "provider": model.provider.value,
-                "state": circuit_breaker.state,
+                "state": circuit_breaker.state.name,
                 "failure_count": circuit_breaker.failure_count,
-                "last_failure": circuit_breaker.last_failure_time.isoformat() if circuit_breaker.last_failure_time else None,
+                "last_failure": last_failure.isoformat() if last_failure else None,
                 "can_execute": circuit_breaker.can_execute()
             }
         return status
@@ -0,0 +1,72 @@
+"""
+Cache of AI responses keyed by task type and source content hash.
+
+Keys are `(task_type, content_hash)` rather than the rendered prompt, so
+cache hits survive edits to the prompt template and only the (truncated)
+source text is hashed. Lookups are exact and indexed; no embedding model is
+loaded or run on the lookup path.
+"""
+import hashlib
+from typing import Optional
+
+from sqlmodel import Session, select
+
+from app.models.system import PromptCache
+
+
+# Number of leading characters of a document that are sent to the model
+CACHED_CONTENT_CHARS = 4000
+
+
+def compute_content_hash(text: Optional[str]) -> str:
+    """Hash the portion of `text` that is sent to the model."""
+    content = (text or "")[:CACHED_CONTENT_CHARS]
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def lookup(
+    session: Session,
+    task_type: str,
+    content_hash: str,
+    model: Optional[str] = None
+) -> Optional[PromptCache]:
+    """
+    Find a cached response.
+
+    Args:
+        session: Database session
+        task_type: Type of task (summarize, flashcard, quiz, etc.)
+        content_hash: Hash from compute_content_hash()
+        model: Restrict the lookup to responses from this model
+
+    Returns:
+        The most recent matching PromptCache entry, or None
+    """
+    query = select(PromptCache).where(
+        PromptCache.task_type == task_type,
+        PromptCache.content_hash == content_hash
+    )
+    if model is not None:
+        query = query.where(PromptCache.model == model)
+
+    return session.exec(
+        query.order_by(PromptCache.created_at.desc()).limit(1)
+    ).first()
+
+
+def store(
+    session: Session,
+    task_type: str,
+    content_hash: str,
+    model: str,
+    response: str
+) -> PromptCache:
+    """Add a response to the cache. The caller is responsible for committing."""
+    entry = PromptCache(
+        task_type=task_type,
+        content_hash=content_hash,
+        model=model,
+        response=response
+    )
+    session.add(entry)
+    return entry
@@ -1,21 +1,36 @@
 """
 Background tasks for Celery worker.
 """
-import asyncio
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
+from celery import chain
+
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session
-from app.worker import celery_app
+from app.worker import celery_app, run_async
 from app.core.database import get_session
 from app.models.upload import Upload, Document
 from app.models.user import User
 from app.models.networking import Opportunity, Match
 from app.models.system import Log
+from app.services.log_buffer import log_buffer
 from app.services.model_router import model_router
+from app.services import prompt_cache
 from app.utils.pdf_parser import extract_text_from_file
 
+# Publishing from a web request: give up after one quick retry when the
+# broker is unreachable instead of kombu's default of several seconds
+PUBLISH_RETRY_POLICY = {
+    "max_retries": 1,
+    "interval_start": 0,
+    "interval_step": 0.5,
+    "interval_max": 0.5,
+}
+
 
 @celery_app.task(bind=True)
 def process_document_upload(self, upload_id: int):
@@ -30,10 +45,8 @@ def process_document_upload(self, upload_id: int):
         if not upload:
             raise ValueError(f"Upload {upload_id} not found")
 
-        # Update status to processing
+        # Status changes are kept in memory and committed once at the end
         upload.parsing_status = "processing"
-        session.add(upload)
-        session.commit()
 
         # Extract text from file
         try:
@@ -53,43 +66,42 @@ def process_document_upload(self, upload_id: int):
             title=f"Document from {upload.filename}",
             content_summary=text_content[:1000] + "..." if len(text_content) > 1000 else text_content,
             full_content=text_content,
+            content_sha256=prompt_cache.compute_content_hash(text_content),
             word_count=word_count,
             page_count=page_count,
             language="en"  # Could be detected with langdetect
         )
 
-        session.add(document)
-        session.commit()
-
         # Update upload status
         upload.parsing_status = "completed"
+
+        session.add(document)
         session.add(upload)
+        session.flush()
+        document_id = document.id
+        user_id = upload.user_id
         session.commit()
 
         # Log success
-        log = Log(
+        log_buffer.put(
             level="INFO",
             message=f"Document processing completed for upload {upload_id}",
             module="tasks",
             function="process_document_upload",
-            user_id=upload.user_id
+            user_id=user_id
         )
-        session.add(log)
-        session.commit()
 
-        return {"status": "success", "document_id": document.id}
+        return {"status": "success", "document_id": document_id}
 
     except Exception as e:
         # Log error
-        log = Log(
+        log_buffer.put(
             level="ERROR",
             message=f"Document processing failed for upload {upload_id}: {str(e)}",
             module="tasks",
             function="process_document_upload",
-            context=json.dumps({"upload_id": upload_id, "error": str(e)})
+            context={"upload_id": upload_id, "error": str(e)}
         )
-        session.add(log)
-        session.commit()
         raise
 
     finally:
@@ -97,10 +109,18 @@ def process_document_upload(self, upload_id: int):
 
 
 @celery_app.task(bind=True)
-def generate_ai_summary(self, document_id: int, user_id: int):
+def generate_ai_summary(self, prev_result: Union[Dict[str, Any], int], user_id: int):
     """
     Generate AI summary for a document.
+
+    `prev_result` is the result of process_document_upload when the tasks are
+    chained, or a plain document ID when dispatched directly.
     """
+    if isinstance(prev_result, dict):
+        document_id = prev_result["document_id"]
+    else:
+        document_id = prev_result
+
     session: Session = next(get_session())
 
     try:
@@ -109,17 +129,28 @@ def generate_ai_summary(self, document_id: int, user_id: int):
         if not document:
             raise ValueError(f"Document {document_id} not found")
 
-        # Generate summary using AI
-        prompt = f"""
-        Task: Summarize the following text for an undergraduate student in simple English.
-        Output format: JSON {{"title": "...", "summary": "...", "key_points": ["...","..."], "recommended_reading": ["..."]}}
-        Text: {document.full_content[:4000]}
-        """
-
-        response_text, model_used = asyncio.run(model_router.call_model(
-            prompt=prompt,
-            task_type="summarize"
-        ))
+        # Documents created before content hashing get their hash backfilled
+        if document.content_sha256 is None:
+            document.content_sha256 = prompt_cache.compute_content_hash(document.full_content)
+
+        cached = prompt_cache.lookup(session, "summarize", document.content_sha256)
+        if cached:
+            response_text, model_used = cached.response, cached.model
+        else:
+            # Generate summary using AI
+            prompt = f"""
+            Task: Summarize the following text for an undergraduate student in simple English.
+            Output format: JSON {{"title": "...", "summary": "...", "key_points": ["...","..."], "recommended_reading": ["..."]}}
+            Text: {document.full_content[:prompt_cache.CACHED_CONTENT_CHARS]}
+            """
+
+            response_text, model_used = run_async(model_router.call_model(
+                prompt=prompt,
+                task_type="summarize"
+            ))
+            prompt_cache.store(
+                session, "summarize", document.content_sha256, model_used, response_text
+            )
 
         # Parse and update document
         try:
@@ -134,37 +165,47 @@ def generate_ai_summary(self, document_id: int, user_id: int):
         session.commit()
 
         # Log success
-        log = Log(
+        log_buffer.put(
             level="INFO",
             message=f"AI summary generated for document {document_id}",
             module="tasks",
             function="generate_ai_summary",
             user_id=user_id,
-            context=json.dumps({"model_used": model_used})
+            context={"model_used": model_used, "cached": cached is not None}
         )
-        session.add(log)
-        session.commit()
 
         return {"status": "success", "model_used": model_used}
 
     except Exception as e:
         # Log error
-        log = Log(
+        log_buffer.put(
             level="ERROR",
             message=f"AI summary generation failed for document {document_id}: {str(e)}",
             module="tasks",
             function="generate_ai_summary",
             user_id=user_id,
-            context=json.dumps({"document_id": document_id, "error": str(e)})
+            context={"document_id": document_id, "error": str(e)}
         )
-        session.add(log)
-        session.commit()
         raise
 
     finally:
         session.close()
 
 
+def enqueue_document_pipeline(upload_id: int, user_id: int):
+    """
+    Queue processing and summarization of an upload as one Celery chain.
+
+    The summary task starts as soon as processing finishes, on the same
+    worker hop, instead of being dispatched separately afterwards.
+    """
+    pipeline = chain(
+        process_document_upload.s(upload_id),
+        generate_ai_summary.s(user_id=user_id)
+    )
+    return pipeline.apply_async(retry_policy=PUBLISH_RETRY_POLICY)
+
+
 @celery_app.task(bind=True)
 def scrape_scholarships(self):
     """
@@ -213,28 +254,24 @@ def scrape_scholarships(self):
         session.commit()
 
         # Log success
-        log = Log(
+        log_buffer.put(
             level="INFO",
             message=f"Scraped {len(mock_opportunities)} opportunities",
             module="tasks",
             function="scrape_scholarships"
         )
-        session.add(log)
-        session.commit()
 
         return {"status": "success", "opportunities_scraped": len(mock_opportunities)}
 
     except Exception as e:
         # Log error
-        log = Log(
+        log_buffer.put(
             level="ERROR",
             message=f"Scholarship scraping failed: {str(e)}",
             module="tasks",
             function="scrape_scholarships",
-            context=json.dumps({"error": str(e)})
+            context={"error": str(e)}
         )
-        session.add(log)
-        session.commit()
         raise
 
     finally:
@@ -287,28 +324,24 @@ def update_user_matches(self):
         session.commit()
 
         # Log success
-        log = Log(
+        log_buffer.put(
             level="INFO",
             message=f"Created {matches_created} new user matches",
             module="tasks",
             function="update_user_matches"
         )
-        session.add(log)
-        session.commit()
 
         return {"status": "success", "matches_created": matches_created}
 
     except Exception as e:
         # Log error
-        log = Log(
+        log_buffer.put(
             level="ERROR",
             message=f"User match update failed: {str(e)}",
             module="tasks",
             function="update_user_matches",
-            context=json.dumps({"error": str(e)})
+            context={"error": str(e)}
         )
-        session.add(log)
-        session.commit()
         raise
 
     finally:
@@ -323,43 +356,41 @@ def cleanup_old_data(self):
     session: Session = next(get_session())
 
     try:
-        # Delete logs older than 90 days
-        cutoff_date = datetime.utcnow() - timedelta(days=90)
-        old_logs = session.query(Log).filter(Log.created_at < cutoff_date).delete()
+        now = datetime.utcnow()
 
-        # Delete completed uploads older than 180 days
+        # Find completed uploads older than 180 days
         # (Keep recent ones for reference)
-        old_uploads = session.query(Upload).filter(
-            Upload.created_at < (datetime.utcnow() - timedelta(days=180)),
-            Upload.parsing_status == "completed"
+        old_uploads = session.execute(
+            select(Upload.id, Upload.filepath).where(
+                Upload.created_at < (now - timedelta(days=180)),
+                Upload.parsing_status == "completed"
+            )
         ).all()
-
-        deleted_files = 0
-        for upload in old_uploads:
-            # Delete physical file
-            try:
-                if os.path.exists(upload.filepath):
-                    os.remove(upload.filepath)
-                    deleted_files += 1
-            except:
-                pass  # File might already be deleted
-
-        # Delete upload records
-        deleted_uploads = len(old_uploads)
-        for upload in old_uploads:
-            session.delete(upload)
+        upload_ids = [upload_id for upload_id, _ in old_uploads]
+
+        # Delete physical files in parallel
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            deleted_files = sum(executor.map(_safe_unlink, [path for _, path in old_uploads]))
+
+        # Delete upload records and logs older than 90 days in one transaction
+        deleted_uploads = 0
+        if upload_ids:
+            deleted_uploads = session.execute(
+                delete(Upload).where(Upload.id.in_(upload_ids))
+            ).rowcount
+        old_logs = session.execute(
+            delete(Log).where(Log.created_at < (now - timedelta(days=90)))
+        ).rowcount
 
         session.commit()
 
         # Log success
-        log = Log(
+        log_buffer.put(
             level="INFO",
             message=f"Cleaned up {old_logs} old logs and {deleted_uploads} old uploads ({deleted_files} files deleted)",
             module="tasks",
             function="cleanup_old_data"
         )
-        session.add(log)
-        session.commit()
 
         return {
             "status": "success",
@@ -370,21 +401,28 @@ def cleanup_old_data(self):
 
     except Exception as e:
         # Log error
-        log = Log(
+        log_buffer.put(
             level="ERROR",
             message=f"Data cleanup failed: {str(e)}",
             module="tasks",
             function="cleanup_old_data",
-            context=json.dumps({"error": str(e)})
+            context={"error": str(e)}
         )
-        session.add(log)
-        session.commit()
         raise
 
     finally:
         session.close()
 
 
+def _safe_unlink(path: str) -> bool:
+    """Delete a file, returning False if it was already gone or can't be removed."""
+    try:
+        os.unlink(path)
+        return True
+    except OSError:
+        return False
+
+
 def calculate_match_score(user1: User, user2: User) -> float:
     """Calculate match score between two users."""
     try:
@@ -3,7 +3,7 @@ PDF parsing utilities.
 """
 import re
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 
 try:
     import pdfplumber
@@ -30,42 +30,29 @@ def extract_text_from_pdf(file_path: str) -> Tuple[str, int, int]:
     if not file_path_obj.exists():
         raise FileNotFoundError(f"PDF file not found: {file_path}")
 
-    text_content = ""
-    page_count = 0
-
     try:
         if PDFPLUMBER_AVAILABLE:
             # Use pdfplumber for better text extraction
             with pdfplumber.open(file_path) as pdf:
                 page_count = len(pdf.pages)
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content += page_text + "\n\n"
+                text_content, word_count = join_text_chunks(
+                    page.extract_text() for page in pdf.pages
+                )
 
         elif PYPDF2_AVAILABLE:
             # Fallback to PyPDF2
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 page_count = len(pdf_reader.pages)
-
-                for page_num in range(page_count):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content += page_text + "\n\n"
+                text_content, word_count = join_text_chunks(
+                    page.extract_text() for page in pdf_reader.pages
+                )
         else:
             raise ImportError("Neither pdfplumber nor PyPDF2 is available")
 
     except Exception as e:
         raise Exception(f"Failed to extract text from PDF: {str(e)}")
 
-    # Clean up the text
-    text_content = clean_extracted_text(text_content)
-
-    # Count words
-    word_count = len(text_content.split())
-
     return text_content, word_count, page_count
 
 
@@ -89,11 +76,8 @@ def extract_text_from_txt(file_path: str) -> Tuple[str, int, int]:
         with open(file_path, 'r', encoding='latin-1') as file:
             text_content = file.read()
 
-    # Clean up the text
-    text_content = clean_extracted_text(text_content)
-
-    # Count words
-    word_count = len(text_content.split())
+    # Clean up the text and count words
+    text_content, word_count = join_text_chunks([text_content])
 
     # For text files, we consider it as 1 page
     page_count = 1
@@ -120,6 +104,29 @@ def clean_extracted_text(text: str) -> str:
     return text
 
 
+def join_text_chunks(chunks: Iterable[Optional[str]]) -> Tuple[str, int]:
+    """
+    Clean, word-count and join text chunks (e.g. pages) in a single pass.
+
+    Each chunk is processed once and the result is built with one join,
+    instead of concatenating the whole document and re-scanning it to clean
+    and count words.
+
+    Returns:
+        Tuple of (text_content, word_count)
+    """
+    parts = []
+    word_count = 0
+
+    for chunk in chunks:
+        chunk = clean_extracted_text(chunk)
+        if chunk:
+            parts.append(chunk)
+            word_count += len(chunk.split())
+
+    return "\n\n".join(parts), word_count
+
+
 def extract_text_from_file(file_path: str, file_type: str) -> Tuple[str, int, int]:
     """
     Extract text from file based on type.
@@ -1,8 +1,10 @@
 """
 Celery worker configuration and task definitions.
 """
+import asyncio
 import os
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from app.core.config import settings
 
 
@@ -52,5 +54,45 @@ celery_app.conf.update(
 )
 
 
+@worker_process_init.connect
+def init_worker_event_loop(**kwargs):
+    """
+    Install a long-lived event loop in each worker process.
+
+    Tasks run their coroutines on this loop instead of creating and tearing
+    down a new one per task with asyncio.run().
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    # Rebuild the model router's HTTP client so its pool belongs to this loop
+    from app.services.model_router import model_router
+    model_router.reset_client()
+
+    # Start the batched Log writer for this process
+    from app.services.log_buffer import log_buffer
+    log_buffer.start()
+
+
+@worker_process_shutdown.connect
+def flush_worker_logs(**kwargs):
+    """Flush buffered Log rows and close pooled connections before exit."""
+    from app.services.log_buffer import log_buffer
+    log_buffer.stop()
+
+    from app.services.model_router import model_router
+    run_async(model_router.close())
+
+
+def run_async(coro):
+    """Run a coroutine to completion on the worker's event loop."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
 if __name__ == "__main__":
     celery_app.start()
\ No newline at end of file
@@ -2,38 +2,66 @@
 Pytest configuration and fixtures for Studagent backend tests.
 """
 
-import asyncio
-import os
-import tempfile
-from typing import Generator
+import json
+from datetime import timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Generator, List
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel
 
 from app.core.config import settings
-from app.core.database import Base, get_db
+from app.core.database import get_session
+from app.core.rate_limit import RateLimiter
+from app.core.security import create_access_token, get_password_hash, pwd_context
 from app.main import app
+from app.models.user import User
 
+# Sessions served by the get_session override; the innermost (per-test) one wins
+_db_session_stack = []
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Sample rows shared with scripts/seed_data.py
+SEED_DATA_DIR = Path(__file__).parent.parent / "scripts" / "seed_data"
+
+
+@lru_cache(maxsize=None)
+def _load_seed_rows(name: str):
+    """Read a seed data file once per test session."""
+    with open(SEED_DATA_DIR / f"{name}.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _sample_row(name: str) -> dict:
+    """
+    Copy of the first seed row for `name`, without its foreign keys.
+
+    Seed rows point at their parents by list index, so those keys are left
+    out; tests that insert the row set `user_id` and friends themselves.
+    """
+    return {
+        key: value
+        for key, value in _load_seed_rows(name)[0].items()
+        if not key.endswith("_index")
+    }
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Don't use the production bcrypt cost in tests."""
+    pwd_context.update(bcrypt__rounds=4)
 
 
 @pytest.fixture(scope="session")
 def test_db():
     """Create a test database."""
-    # Create a temporary database file
-    db_fd, db_path = tempfile.mkstemp()
-
-    # Create test database URL
-    test_database_url = f"sqlite:///{db_path}"
+    # In-memory database; StaticPool shares its single connection across sessions.
+    # Each pytest-xdist worker is its own process, so it gets its own database.
+    test_database_url = "sqlite:///:memory:"
 
     # Create engine
     engine = create_engine(
@@ -42,44 +70,131 @@ def test_db():
         poolclass=StaticPool,
     )
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        # Stop pysqlite from opening its own implicit per-statement transactions
+        dbapi_connection.isolation_level = None
+
+        # Throwaway database: skip journaling and fsyncs
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(connection):
+        # Start one explicit transaction per SQLAlchemy transaction instead
+        connection.exec_driver_sql("BEGIN")
+
+    # Create all tables; the database is brand new, so skip existence checks
+    SQLModel.metadata.create_all(bind=engine, checkfirst=False)
 
     yield engine
 
-    # Cleanup
-    os.close(db_fd)
-    os.unlink(db_path)
+    engine.dispose()
 
 
-@pytest.fixture(scope="function")
-def db_session(test_db):
-    """Create a database session for testing."""
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_db)
+@pytest.fixture(scope="module")
+def db_connection(test_db):
+    """
+    Connection shared by every session in a test module.
 
-    session = TestingSessionLocal()
+    Its outer transaction is rolled back after the module, so data created by
+    module-scoped fixtures never leaks into the next module.
+    """
+    connection = test_db.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+def _bind_session(connection, **kwargs):
+    """Session joined to `connection`; commits only release a SAVEPOINT."""
+    TestingSessionLocal = sessionmaker(
+        class_=Session,
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        **kwargs
+    )
+    return TestingSessionLocal()
+
+
+@pytest.fixture(scope="module")
+def module_db_session(db_connection):
+    """
+    Session for module-scoped setup such as users shared by a test class.
+
+    Only use it while setting up; objects stay loaded after commit so tests
+    can read them without touching this session again.
+    """
+    session = _bind_session(db_connection, expire_on_commit=False)
+    _db_session_stack.append(session)
     try:
         yield session
     finally:
+        _db_session_stack.remove(session)
         session.close()
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
-    """Create a test client with database session."""
+def db_session(db_connection):
+    """
+    Create a database session for testing.
+
+    Each test runs inside its own SAVEPOINT on the module's connection, rolled
+    back afterwards, so every test sees the module's fixtures and nothing
+    else without recreating the schema.
+    """
+    nested = db_connection.begin_nested()
+
+    session = _bind_session(db_connection)
+    _db_session_stack.append(session)
+    try:
+        yield session
+    finally:
+        _db_session_stack.remove(session)
+        session.close()
+        nested.rollback()
 
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            db_session.close()
 
-    app.dependency_overrides[get_db] = override_get_db
+@pytest.fixture(scope="session", autouse=True)
+def override_get_session_dependency():
+    """Route get_session to the current test's db_session for the whole session."""
 
+    def override_get_session():
+        # db_session owns the session lifecycle; closing it here would
+        # discard the test's transaction after the first request
+        yield _db_session_stack[-1]
+
+    app.dependency_overrides[get_session] = override_get_session
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def test_client():
+    """One TestClient, so app startup runs once per test session."""
     with TestClient(app) as test_client:
         yield test_client
 
-    app.dependency_overrides.clear()
+
+@pytest.fixture(scope="module")
+def client_module(test_client, module_db_session):
+    """Test client for module-scoped fixtures; requests use module_db_session."""
+    return test_client
+
+
+@pytest.fixture(scope="function")
+def client(test_client, db_session):
+    """Test client whose requests use this test's database session."""
+    return test_client
 
 
 @pytest.fixture(scope="function")
@@ -96,6 +211,28 @@ def test_user_data():
     }
 
 
+@pytest.fixture(scope="module")
+def registered_user(client_module):
+    """
+    User registered once per test module through the API.
+
+    Uses its own email so it never collides with the users created by
+    auth_headers. Returns the registration data merged with the response.
+    """
+    user_data = {
+        "email": "registered@example.com",
+        "password": "registeredpassword123",
+        "display_name": "Registered User",
+        "first_name": "Registered",
+        "last_name": "User",
+        "role": "student",
+        "is_active": True
+    }
+    response = client_module.post("/api/v1/auth/register", json=user_data)
+    assert response.status_code == 200, response.text
+    return {**user_data, **response.json()}
+
+
 @pytest.fixture(scope="function")
 def test_admin_data():
     """Sample admin user data for testing."""
@@ -110,67 +247,125 @@ def test_admin_data():
     }
 
 
+@pytest.fixture(scope="session")
+def _password_hash():
+    """bcrypt hashes cached per password for the whole test session."""
+    return lru_cache(maxsize=None)(get_password_hash)
+
+
+@pytest.fixture(scope="session")
+def _auth_token():
+    """Bearer tokens cached per email for the whole test session."""
+
+    @lru_cache(maxsize=None)
+    def token_for(email: str) -> str:
+        return create_access_token(subject=email, expires_delta=timedelta(hours=12))
+
+    return token_for
+
+
+def _create_test_users(session, users_data, password_hash) -> List[User]:
+    """Insert users directly in one batch, skipping the register endpoint."""
+    users = [
+        User(
+            email=user_data["email"],
+            hashed_password=password_hash(user_data["password"]),
+            display_name=user_data["display_name"],
+            role=user_data.get("role", "student"),
+            is_active=user_data.get("is_active", True)
+        )
+        for user_data in users_data
+    ]
+    # Same-table rows added together are flushed as a single executemany
+    session.add_all(users)
+    session.commit()
+    return users
+
+
+def _create_test_user(session, user_data, password_hash) -> User:
+    """Insert a user directly, skipping the register endpoint."""
+    return _create_test_users(session, [user_data], password_hash)[0]
+
+
 @pytest.fixture(scope="function")
-def auth_headers(client, test_user_data):
+def auth_headers(db_session, test_user_data, _password_hash, _auth_token):
     """Create authentication headers for testing."""
-    # Register user
-    client.post("/api/v1/auth/register", json=test_user_data)
+    # The user row lives in the test's transaction; hash and token are reused
+    _create_test_user(db_session, test_user_data, _password_hash)
 
-    # Login to get token
-    response = client.post("/api/v1/auth/login", data={
-        "username": test_user_data["email"],
-        "password": test_user_data["password"]
-    })
-
-    token = response.json()["access_token"]
+    token = _auth_token(test_user_data["email"])
     return {"Authorization": f"Bearer {token}"}
 
 
 @pytest.fixture(scope="function")
-def admin_auth_headers(client, test_admin_data):
+def admin_auth_headers(db_session, test_admin_data, _password_hash, _auth_token):
     """Create admin authentication headers for testing."""
-    # Register admin
-    client.post("/api/v1/auth/register", json=test_admin_data)
+    _create_test_user(db_session, test_admin_data, _password_hash)
+
+    token = _auth_token(test_admin_data["email"])
+    return {"Authorization": f"Bearer {token}"}
+
 
-    # Login to get token
-    response = client.post("/api/v1/auth/login", data={
-        "username": test_admin_data["email"],
-        "password": test_admin_data["password"]
-    })
+@pytest.fixture(scope="module")
+def sample_user(module_db_session, _password_hash):
+    """
+    User shared by every test in the module, for tests that only need an owner.
 
-    token = response.json()["access_token"]
+    Tests that change the user itself should create their own instead.
+    """
+    user_data = {
+        "email": "sample.user@example.com",
+        "password": "samplepassword123",
+        "display_name": "Sample User",
+        "role": "student",
+        "is_active": True
+    }
+    return _create_test_user(module_db_session, user_data, _password_hash)
+
+
+@pytest.fixture(scope="module")
+def auth_headers_module(module_db_session, _password_hash, _auth_token):
+    """Authentication headers for a user shared by every test in the module."""
+    user_data = {
+        "email": "module.user@example.com",
+        "password": "modulepassword123",
+        "display_name": "Module User",
+        "role": "student",
+        "is_active": True
+    }
+    _create_test_user(module_db_session, user_data, _password_hash)
+
+    token = _auth_token(user_data["email"])
     return {"Authorization": f"Bearer {token}"}
 
 
+@pytest.fixture(scope="module")
+def me_payload(client_module, auth_headers_module):
+    """/users/me response for auth_headers_module, fetched once per module."""
+    response = client_module.get("/api/v1/users/me", headers=auth_headers_module)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.fixture(scope="function")
+def low_rate_limiter():
+    """Rate limiter that rejects the third request within a minute."""
+    return RateLimiter(max_requests=2, window=60)
+
+
 @pytest.fixture(scope="function")
 def sample_document_data():
     """Sample document data for testing."""
-    return {
-        "filename": "test_document.pdf",
-        "content_type": "application/pdf",
-        "size": 1024000,  # 1MB
-        "user_id": 1
-    }
+    return _sample_row("documents")
 
 
 @pytest.fixture(scope="function")
 def sample_flashcard_data():
     """Sample flashcard data for testing."""
-    return {
-        "question": "What is the capital of France?",
-        "answer": "Paris",
-        "document_id": 1,
-        "user_id": 1
-    }
+    return _sample_row("flashcards")
 
 
 @pytest.fixture(scope="function")
 def sample_deadline_data():
     """Sample deadline data for testing."""
-    return {
-        "title": "Submit Assignment",
-        "description": "Submit the final project assignment",
-        "due_date": "2024-12-31T23:59:59Z",
-        "priority": "high",
-        "user_id": 1
-    }
\ No newline at end of file
+    return _sample_row("deadlines")
@@ -6,6 +6,10 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock
 
+from app.core.config import settings
+from app.core.rate_limit import get_rate_limiter
+from app.main import app
+
 
 class TestAIApi:
     """Test cases for AI API endpoints."""
@@ -161,19 +165,23 @@ class TestAIApi:
         assert "opportunities" in data
         mock_process_request.assert_called_once()
 
-    def test_ai_endpoints_rate_limiting(self, client: TestClient, auth_headers):
+    @patch('app.services.model_router.ModelRouter.call_model', new_callable=AsyncMock)
+    def test_ai_endpoints_rate_limiting(self, mock_call_model, client: TestClient, auth_headers, low_rate_limiter, monkeypatch):
         """Test rate limiting on AI endpoints."""
-        # Make multiple requests quickly
-        for i in range(10):
-            response = client.post("/api/v1/ai/summarize", json={
+        mock_call_model.return_value = ("Summary", "mistral-7b")
+        # The client outlives this test, so the override must be undone after it
+        monkeypatch.setitem(app.dependency_overrides, get_rate_limiter, lambda: low_rate_limiter)
+
+        responses = [
+            client.post("/api/v1/ai/summarize", json={
                 "text": f"Test text {i}"
             }, headers=auth_headers)
+            for i in range(3)
+        ]
 
-            if response.status_code == 429:  # Too Many Requests
-                break
-
-        # Should eventually hit rate limit
-        # Note: This depends on rate limiting configuration
+        # The limiter allows two requests, so exactly the third is rejected
+        assert [r.status_code for r in responses] == [200, 200, 429]  # Too Many Requests
+        assert mock_call_model.await_count == 2
 
     @patch('app.services.model_router.ModelRouter.process_request')
     def test_ai_endpoint_model_failure_fallback(self, mock_process_request, client: TestClient, auth_headers):
@@ -214,16 +222,19 @@ class TestAIApi:
 
         assert response.status_code == 422  # Validation error
 
-    @patch('app.services.model_router.ModelRouter.process_request')
-    def test_ai_endpoint_timeout_handling(self, mock_process_request, client: TestClient, auth_headers):
+    @patch('app.services.model_router.ModelRouter.call_model')
+    def test_ai_endpoint_timeout_handling(self, mock_call_model, client: TestClient, auth_headers, monkeypatch):
         """Test AI endpoint timeout handling."""
         from asyncio import sleep
 
-        async def delayed_response():
-            await sleep(35)  # Longer than timeout
-            return "Delayed response"
+        # Shrink the request timeout; it is read on every call
+        monkeypatch.setattr(settings, "LLM_REQUEST_TIMEOUT_SECONDS", 0.01)
 
-        mock_process_request.side_effect = delayed_response
+        async def delayed_response(*args, **kwargs):
+            await sleep(1)  # Longer than timeout; cancelled when it expires
+            return "Delayed response", "mistral-7b"
+
+        mock_call_model.side_effect = delayed_response
 
         request_data = {
             "text": "Test document",
@@ -232,24 +243,20 @@ class TestAIApi:
 
         response = client.post("/api/v1/ai/summarize", json=request_data, headers=auth_headers)
 
-        # Should handle timeout gracefully
-        # This depends on the actual timeout implementation
-        assert response.status_code in [200, 504]  # Success or Gateway Timeout
-
-    def test_ai_endpoints_unauthenticated(self, client: TestClient):
+        assert response.status_code == 504  # Gateway Timeout
+
+    @pytest.mark.parametrize("endpoint", [
+        "/api/v1/ai/summarize",
+        "/api/v1/ai/flashcards",
+        "/api/v1/ai/quiz",
+        "/api/v1/ai/match-partners",
+        "/api/v1/ai/write",
+        "/api/v1/ai/scholarship-alerts"
+    ])
+    def test_ai_endpoints_unauthenticated(self, endpoint, client: TestClient):
         """Test AI endpoints without authentication."""
-        endpoints = [
-            "/api/v1/ai/summarize",
-            "/api/v1/ai/flashcards",
-            "/api/v1/ai/quiz",
-            "/api/v1/ai/match-partners",
-            "/api/v1/ai/write",
-            "/api/v1/ai/scholarship-alerts"
-        ]
-
-        for endpoint in endpoints:
-            response = client.post(endpoint, json={"text": "test"})
-            assert response.status_code == 401
+        response = client.post(endpoint, json={"text": "test"})
+        assert response.status_code == 401
 
     @patch('app.services.model_router.ModelRouter.get_model_status')
     def test_ai_model_status_endpoint(self, mock_get_status, client: TestClient, admin_auth_headers):
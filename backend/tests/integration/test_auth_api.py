@@ -9,6 +9,7 @@ from fastapi.testclient import TestClient
 class TestAuthAPI:
     """Test cases for authentication API endpoints."""
 
+    @pytest.mark.slow
     def test_register_user_success(self, client: TestClient, test_user_data):
         """Test successful user registration."""
         response = client.post("/api/v1/auth/register", json=test_user_data)
@@ -20,14 +21,15 @@ class TestAuthAPI:
         assert "token_type" in data
         assert data["token_type"] == "bearer"
 
-    def test_register_user_duplicate_email(self, client: TestClient, test_user_data):
+    @pytest.mark.slow
+    def test_register_user_duplicate_email(self, client: TestClient, registered_user):
         """Test registration with duplicate email."""
-        # Register first user
-        client.post("/api/v1/auth/register", json=test_user_data)
-
-        # Try to register with same email
-        duplicate_data = test_user_data.copy()
-        duplicate_data["display_name"] = "Different User"
+        # Try to register again with the module user's email
+        duplicate_data = {
+            **registered_user,
+            "display_name": "Different User",
+            "password": "differentpassword123"
+        }
 
         response = client.post("/api/v1/auth/register", json=duplicate_data)
 
@@ -48,15 +50,12 @@ class TestAuthAPI:
 
         assert response.status_code == 422  # Validation error
 
-    def test_login_success(self, client: TestClient, test_user_data):
+    @pytest.mark.slow
+    def test_login_success(self, client: TestClient, registered_user):
         """Test successful login."""
-        # First register the user
-        client.post("/api/v1/auth/register", json=test_user_data)
-
-        # Then login
         login_data = {
-            "username": test_user_data["email"],
-            "password": test_user_data["password"]
+            "username": registered_user["email"],
+            "password": registered_user["password"]
         }
 
         response = client.post("/api/v1/auth/login", data=login_data)
@@ -67,14 +66,11 @@ class TestAuthAPI:
         assert "refresh_token" in data
         assert "token_type" in data
 
-    def test_login_wrong_password(self, client: TestClient, test_user_data):
+    @pytest.mark.slow
+    def test_login_wrong_password(self, client: TestClient, registered_user):
         """Test login with wrong password."""
-        # Register user
-        client.post("/api/v1/auth/register", json=test_user_data)
-
-        # Try login with wrong password
         login_data = {
-            "username": test_user_data["email"],
+            "username": registered_user["email"],
             "password": "wrongpassword"
         }
 
@@ -98,14 +94,13 @@ class TestAuthAPI:
         data = response.json()
         assert "detail" in data
 
-    def test_refresh_token_success(self, client: TestClient, test_user_data):
+    @pytest.mark.slow
+    def test_refresh_token_success(self, client: TestClient, registered_user):
         """Test successful token refresh."""
-        # Register and login to get tokens
-        client.post("/api/v1/auth/register", json=test_user_data)
-
+        # Login to get tokens
         login_response = client.post("/api/v1/auth/login", data={
-            "username": test_user_data["email"],
-            "password": test_user_data["password"]
+            "username": registered_user["email"],
+            "password": registered_user["password"]
         })
 
         refresh_token = login_response.json()["refresh_token"]
@@ -139,9 +134,9 @@ class TestAuthAPI:
         assert "message" in data
         assert "logged out" in data["message"].lower()
 
-    def test_get_current_user_authenticated(self, client: TestClient, auth_headers):
+    def test_get_current_user_authenticated(self, client: TestClient, auth_headers_module):
         """Test getting current user when authenticated."""
-        response = client.get("/api/v1/users/me", headers=auth_headers)
+        response = client.get("/api/v1/users/me", headers=auth_headers_module)
 
         assert response.status_code == 200
         data = response.json()
@@ -157,7 +152,7 @@ class TestAuthAPI:
         data = response.json()
         assert "detail" in data
 
-    def test_update_user_profile(self, client: TestClient, auth_headers):
+    def test_update_user_profile(self, client: TestClient, auth_headers_module):
         """Test updating user profile."""
         update_data = {
             "display_name": "Updated Name",
@@ -165,7 +160,7 @@ class TestAuthAPI:
             "interests": ["AI", "Machine Learning"]
         }
 
-        response = client.put("/api/v1/users/me", json=update_data, headers=auth_headers)
+        response = client.put("/api/v1/users/me", json=update_data, headers=auth_headers_module)
 
         assert response.status_code == 200
         data = response.json()
@@ -173,47 +168,42 @@ class TestAuthAPI:
         assert data["bio"] == "Updated bio"
         assert "AI" in data["interests"]
 
-    def test_update_user_profile_invalid_data(self, client: TestClient, auth_headers):
+    def test_update_user_profile_invalid_data(self, client: TestClient, auth_headers_module):
         """Test updating user profile with invalid data."""
         update_data = {
             "email": "invalid-email",  # Invalid email
             "display_name": ""  # Empty display name
         }
 
-        response = client.put("/api/v1/users/me", json=update_data, headers=auth_headers)
+        response = client.put("/api/v1/users/me", json=update_data, headers=auth_headers_module)
 
         assert response.status_code == 422  # Validation error
 
-    def test_get_user_by_id(self, client: TestClient, auth_headers, test_user_data):
+    def test_get_user_by_id(self, client: TestClient, auth_headers_module, me_payload):
         """Test getting user by ID."""
-        # First get current user to get ID
-        me_response = client.get("/api/v1/users/me", headers=auth_headers)
-        user_id = me_response.json()["id"]
+        user_id = me_payload["id"]
 
-        # Then get user by ID
-        response = client.get(f"/api/v1/users/{user_id}", headers=auth_headers)
+        response = client.get(f"/api/v1/users/{user_id}", headers=auth_headers_module)
 
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == user_id
-        assert data["email"] == test_user_data["email"]
+        assert data["email"] == me_payload["email"]
 
-    def test_get_user_by_id_not_found(self, client: TestClient, auth_headers):
+    def test_get_user_by_id_not_found(self, client: TestClient, auth_headers_module):
         """Test getting user by ID when user doesn't exist."""
-        response = client.get("/api/v1/users/99999", headers=auth_headers)
+        response = client.get("/api/v1/users/99999", headers=auth_headers_module)
 
         assert response.status_code == 404
         data = response.json()
         assert "detail" in data
         assert "not found" in data["detail"].lower()
 
-    def test_password_reset_request(self, client: TestClient, test_user_data):
+    @pytest.mark.slow
+    def test_password_reset_request(self, client: TestClient, registered_user):
         """Test password reset request."""
-        # Register user first
-        client.post("/api/v1/auth/register", json=test_user_data)
-
         reset_data = {
-            "email": test_user_data["email"]
+            "email": registered_user["email"]
         }
 
         response = client.post("/api/v1/auth/forgot-password", json=reset_data)
@@ -0,0 +1,30 @@
+"""
+Pytest fixtures for unit tests.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from app.core.security import get_password_hash
+
+
+@pytest.fixture(scope="session")
+def hashed_password123():
+    """bcrypt hash of "password123", computed once per test session."""
+    return get_password_hash("password123")
+
+
+@pytest.fixture
+def mock_db():
+    """Mock database session to pass to dependencies such as get_current_user."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_jwt(monkeypatch):
+    """Mock standing in for the jwt.decode used by decode_token; set its return_value."""
+    decode = Mock()
+    monkeypatch.setattr("app.core.security.jwt.decode", decode)
+    return decode
+
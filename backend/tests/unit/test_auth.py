@@ -6,21 +6,27 @@ import pytest
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
-from app.core.auth import (
-    authenticate_user,
+from fastapi.security import HTTPAuthorizationCredentials
+from freezegun import freeze_time
+
+from app.core.auth import get_current_user, get_current_active_user
+from app.core.security import (
     create_access_token,
     create_refresh_token,
     get_password_hash,
-    verify_password,
-    get_current_user,
-    get_current_active_user
+    verify_password
 )
 from app.models.user import User
 
 
+# Wall-clock time seen by TestDependencyInjection
+FROZEN_NOW = datetime(2025, 1, 1)
+
+
 class TestPasswordHashing:
     """Test cases for password hashing functions."""
 
+    @pytest.mark.slow
     def test_password_hash_creation(self):
         """Test creating password hash."""
         password = "testpassword123"
@@ -30,21 +36,18 @@ class TestPasswordHashing:
         assert len(hashed) > 0
         assert "$" in hashed  # bcrypt format
 
-    def test_password_verification(self):
+    @pytest.mark.slow
+    def test_password_verification(self, hashed_password123):
         """Test password verification."""
-        password = "testpassword123"
-        hashed = get_password_hash(password)
-
-        assert verify_password(password, hashed) is True
-        assert verify_password("wrongpassword", hashed) is False
+        assert verify_password("password123", hashed_password123) is True
+        assert verify_password("wrongpassword", hashed_password123) is False
 
-    def test_password_verification_wrong_password(self):
+    @pytest.mark.slow
+    def test_password_verification_wrong_password(self, hashed_password123):
         """Test password verification with wrong password."""
-        password = "testpassword123"
         wrong_password = "wrongpassword"
-        hashed = get_password_hash(password)
 
-        assert verify_password(wrong_password, hashed) is False
+        assert verify_password(wrong_password, hashed_password123) is False
 
 
 class TestTokenCreation:
@@ -80,105 +83,34 @@ class TestTokenCreation:
         assert len(token.split(".")) == 3
 
 
-class TestUserAuthentication:
-    """Test cases for user authentication."""
-
-    @patch('app.core.auth.get_db')
-    def test_authenticate_user_success(self, mock_get_db):
-        """Test successful user authentication."""
-        # Mock database session
-        mock_session = Mock()
-        mock_get_db.return_value = mock_session
-
-        # Mock user
-        mock_user = Mock()
-        mock_user.email = "test@example.com"
-        mock_user.hashed_password = get_password_hash("password123")
-        mock_user.is_active = True
-
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_user
-
-        result = authenticate_user(mock_session, "test@example.com", "password123")
-
-        assert result is not None
-        assert result.email == "test@example.com"
-
-    @patch('app.core.auth.get_db')
-    def test_authenticate_user_wrong_password(self, mock_get_db):
-        """Test authentication with wrong password."""
-        mock_session = Mock()
-        mock_get_db.return_value = mock_session
-
-        mock_user = Mock()
-        mock_user.email = "test@example.com"
-        mock_user.hashed_password = get_password_hash("password123")
-        mock_user.is_active = True
-
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_user
-
-        result = authenticate_user(mock_session, "test@example.com", "wrongpassword")
-
-        assert result is False
-
-    @patch('app.core.auth.get_db')
-    def test_authenticate_user_nonexistent(self, mock_get_db):
-        """Test authentication with nonexistent user."""
-        mock_session = Mock()
-        mock_get_db.return_value = mock_session
-
-        mock_session.query.return_value.filter.return_value.first.return_value = None
-
-        result = authenticate_user(mock_session, "nonexistent@example.com", "password123")
-
-        assert result is False
-
-    @patch('app.core.auth.get_db')
-    def test_authenticate_user_inactive(self, mock_get_db):
-        """Test authentication with inactive user."""
-        mock_session = Mock()
-        mock_get_db.return_value = mock_session
-
-        mock_user = Mock()
-        mock_user.email = "test@example.com"
-        mock_user.hashed_password = get_password_hash("password123")
-        mock_user.is_active = False
-
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_user
-
-        result = authenticate_user(mock_session, "test@example.com", "password123")
-
-        assert result is False
-
-
 class TestDependencyInjection:
     """Test cases for FastAPI dependency injection."""
 
-    @patch('app.core.auth.jwt.decode')
-    @patch('app.core.auth.get_db')
-    def test_get_current_user_success(self, mock_get_db, mock_jwt_decode):
+    @pytest.fixture(autouse=True, scope="class")
+    def frozen_clock(self):
+        """Freeze the clock so expiry comparisons are deterministic."""
+        with freeze_time(FROZEN_NOW):
+            yield
+
+    async def test_get_current_user_success(self, mock_db, mock_jwt):
         """Test getting current user successfully."""
         # Mock JWT decode
-        mock_jwt_decode.return_value = {
+        mock_jwt.return_value = {
             "sub": "test@example.com",
-            "exp": datetime.utcnow() + timedelta(hours=1)
+            "exp": FROZEN_NOW + timedelta(hours=1)
         }
 
-        # Mock database session
-        mock_session = Mock()
-        mock_get_db.return_value = mock_session
-
         # Mock user
         mock_user = Mock()
         mock_user.email = "test@example.com"
         mock_user.is_active = True
 
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_user
+        mock_db.query.return_value.filter.return_value.first.return_value = mock_user
 
-        # Mock request
-        mock_request = Mock()
-        mock_request.headers.get.return_value = "Bearer fake_token"
+        # Bearer credentials as extracted by the security scheme
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="fake_token")
 
-        result = get_current_user(mock_request, mock_session)
+        result = await get_current_user(credentials, mock_db)
 
         assert result is not None
         assert result.email == "test@example.com"
@@ -212,10 +144,10 @@ class TestDependencyInjection:
     def test_token_expiry_handling(self):
         """Test token expiry handling."""
         # Create a token that expires in the past
-        past_time = datetime.utcnow() - timedelta(hours=1)
+        past_time = FROZEN_NOW - timedelta(hours=1)
         data = {"sub": "test@example.com", "exp": past_time}
 
-        with patch('app.core.auth.jwt.decode') as mock_decode:
+        with patch('app.core.security.jwt.decode') as mock_decode:
             mock_decode.return_value = data
 
             with pytest.raises(Exception):  # Should raise JWT error
@@ -2,8 +2,8 @@
 Unit tests for Model Router component.
 """
 
+import httpx
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime, timedelta
 
 from app.services.model_router import ModelRouter, ModelStatus
@@ -18,6 +18,16 @@ class TestModelRouter:
         """Create a ModelRouter instance for testing."""
         return ModelRouter()
 
+    @pytest.fixture
+    def make_mock_client(self, model_router):
+        """Factory giving the router a client that returns `responses` in order."""
+        def _make(responses):
+            pending = iter(responses)
+            transport = httpx.MockTransport(lambda request: next(pending))
+            model_router.client = httpx.AsyncClient(transport=transport)
+            return model_router.client
+        return _make
+
     def test_model_router_initialization(self, model_router):
         """Test ModelRouter initialization."""
         assert model_router is not None
@@ -32,50 +42,36 @@ class TestModelRouter:
         # Should include our configured models
         assert "mistral-7b" in models
 
-    @patch('app.services.model_router.httpx.AsyncClient')
-    async def test_call_model_success(self, mock_client, model_router):
+    async def test_call_model_success(self, make_mock_client, model_router):
         """Test successful model call."""
-        # Mock the HTTP client
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Test response"}}]
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value = mock_client_instance
-        mock_client_instance.post.return_value = mock_response
-        mock_client.return_value = mock_client_instance
-
-        result = await model_router.call_model(
-            model="mistral-7b",
+        make_mock_client([
+            httpx.Response(200, json={"choices": [{"message": {"content": "Test response"}}]})
+        ])
+
+        content, model_name = await model_router.call_model(
             prompt="Test prompt",
-            task_type="summarize"
+            task_type="summarize",
+            priority_list=["mistral-7b"]
         )
 
-        assert result is not None
-        assert "Test response" in result
+        assert content == "Test response"
+        assert model_name == "mistral-7b"
 
-    @patch('app.services.model_router.httpx.AsyncClient')
-    async def test_call_model_failure(self, mock_client, model_router):
+    async def test_call_model_failure(self, make_mock_client, model_router):
         """Test model call failure."""
-        # Mock a failed response
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.raise_for_status.side_effect = Exception("Server error")
+        # Server error response
+        make_mock_client([httpx.Response(500)])
 
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value = mock_client_instance
-        mock_client_instance.post.return_value = mock_response
-        mock_client.return_value = mock_client_instance
-
-        with pytest.raises(Exception):
+        with pytest.raises(Exception, match="All models failed"):
             await model_router.call_model(
-                model="mistral-7b",
                 prompt="Test prompt",
-                task_type="summarize"
+                task_type="summarize",
+                priority_list=["mistral-7b"]
             )
 
+        # The 500 itself was the failure, not a bad call signature
+        assert model_router.circuit_breakers["mistral-7b"].failure_count == 1
+
     def test_update_model_status(self, model_router):
         """Test updating model status."""
         model_router.update_model_status("mistral-7b", ModelStatus.DEGRADED)
@@ -118,30 +114,13 @@ class TestModelRouter:
         assert next_model != first_model
         assert next_model in model_router.get_available_models()
 
-    @patch('app.services.model_router.httpx.AsyncClient')
-    async def test_process_request_with_fallback(self, mock_client, model_router):
+    async def test_process_request_with_fallback(self, make_mock_client, model_router):
         """Test request processing with fallback."""
-        # Mock first model failure
-        mock_response_fail = Mock()
-        mock_response_fail.status_code = 500
-        mock_response_fail.raise_for_status.side_effect = Exception("Server error")
-
-        # Mock second model success
-        mock_response_success = Mock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {
-            "choices": [{"message": {"content": "Fallback response"}}]
-        }
-
-        mock_client_instance = AsyncMock()
-        mock_client_instance.__aenter__.return_value = mock_client_instance
-
         # First call fails, second succeeds
-        mock_client_instance.post.side_effect = [
-            mock_response_fail,  # First model fails
-            mock_response_success  # Second model succeeds
-        ]
-        mock_client.return_value = mock_client_instance
+        make_mock_client([
+            httpx.Response(500),  # First model fails
+            httpx.Response(200, json={"choices": [{"message": {"content": "Fallback response"}}]})  # Second model succeeds
+        ])
 
         result = await model_router.process_request(
             prompt="Test prompt",
@@ -2,62 +2,176 @@
 Unit tests for database models.
 """
 
+from datetime import datetime, timezone
+
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from app.models.user import User
-from app.models.document import Document
-from app.models.flashcard import Flashcard
-from app.models.deadline import Deadline
-from app.models.match import Match
-from app.models.opportunity import Opportunity
+from app.models.upload import Upload, Document
+from app.models.study import Flashcard, Deadline
+from app.models.networking import Match, Opportunity
+
+# Stored as-is; these tests never verify a password, so nothing is hashed
+TEST_HASHED_PASSWORD = "$2b$04$not.a.real.hash.used.only.by.model.tests"
+
+# Shared due date for deadlines and opportunities
+DUE = datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
+
+# (model, field values) for the plain creation test; models with a user_id
+# are owned by sample_user, models with an upload_id by sample_upload
+MODEL_CASES = [
+    pytest.param(User, {
+        "email": "test@example.com",
+        "hashed_password": TEST_HASHED_PASSWORD,
+        "display_name": "Test User",
+        "interests": '["machine learning", "statistics"]',
+        "role": "student",
+        "is_active": True
+    }, id="user"),
+    pytest.param(Upload, {
+        "filename": "test_document.pdf",
+        "filepath": "uploads/test_document.pdf",
+        "file_type": "pdf",
+        "file_size": 2048000  # 2MB
+    }, id="upload"),
+    pytest.param(Document, {
+        "title": "Test Document",
+        "content_summary": "A short summary of the test document",
+        "word_count": 1200
+    }, id="document"),
+    pytest.param(Deadline, {
+        "title": "Submit Assignment",
+        "description": "Submit the final project",
+        "due_date": DUE,
+        "priority": "high",
+        "reminder_settings": '{"days_before": [1, 7]}'
+    }, id="deadline"),
+    pytest.param(Opportunity, {
+        "title": "Software Engineering Internship",
+        "description": "Great opportunity for students",
+        "source": "LinkedIn",
+        "application_url": "https://example.com/job",
+        "tags": '["internship", "software", "engineering"]',
+        "deadline": DUE
+    }, id="opportunity"),
+]
+
+
+@pytest.fixture(scope="module")
+def sample_upload(module_db_session, sample_user: User) -> Upload:
+    """Upload owned by sample_user, for documents that need a parent."""
+    upload = Upload(
+        user_id=sample_user.id,
+        filename="sample.pdf",
+        filepath="uploads/sample.pdf",
+        file_type="pdf",
+        file_size=1024
+    )
+    module_db_session.add(upload)
+    module_db_session.commit()
+    return upload
+
+
+def owned_by(data, model, sample_user: User, sample_upload: Upload) -> dict:
+    """`data` plus the user_id/upload_id that `model` requires."""
+    if hasattr(model, "user_id"):
+        data = {**data, "user_id": sample_user.id}
+    if hasattr(model, "upload_id"):
+        data = {**data, "upload_id": sample_upload.id}
+    return data
+
+
+@pytest.mark.parametrize("model, data", MODEL_CASES)
+def test_model_creation(db_session: Session, sample_user: User, sample_upload: Upload, model, data):
+    """Test creating a row of each model."""
+    data = owned_by(data, model, sample_user, sample_upload)
+
+    instance = model(**data)
+    db_session.add(instance)
+    db_session.flush()
+
+    assert instance.id is not None
+    assert instance.created_at is not None
+    for field, value in data.items():
+        assert getattr(instance, field) == value
+
+
+# (model, required field values, expected values of the fields left unset)
+DEFAULT_CASES = [
+    pytest.param(User, {
+        "email": "defaults@example.com",
+        "hashed_password": TEST_HASHED_PASSWORD,
+        "display_name": "Default User"
+    }, {
+        "role": "student",
+        "is_active": True,
+        "bio": None,
+        "interests": None
+    }, id="user"),
+    pytest.param(Document, {
+        "title": "Default Document",
+        "content_summary": "Summary"
+    }, {
+        "language": "en",
+        "full_content": None
+    }, id="document"),
+    pytest.param(Deadline, {
+        "title": "Test Deadline",
+        "due_date": DUE,
+        "reminder_settings": "{}"
+    }, {
+        "description": None,
+        "priority": "medium",
+        "category": "study",
+        "is_completed": False
+    }, id="deadline"),
+    pytest.param(Opportunity, {
+        "title": "Test Opportunity",
+        "description": "Test description",
+        "source": "Test Source",
+        "tags": "[]"
+    }, {
+        "application_url": None,
+        "opportunity_type": "scholarship",
+        "is_active": True
+    }, id="opportunity"),
+]
+
+
+@pytest.mark.parametrize("model, data, expected", DEFAULT_CASES)
+def test_model_defaults(db_session: Session, sample_user: User, sample_upload: Upload, model, data, expected):
+    """Test that unset fields get their defaults."""
+    data = owned_by(data, model, sample_user, sample_upload)
+
+    # Core INSERT ... RETURNING; the column defaults fill in the rest
+    instance = db_session.scalars(
+        insert(model).returning(model),
+        [data]
+    ).one()
+
+    for field, value in expected.items():
+        assert getattr(instance, field) == value, field
 
 
 class TestUserModel:
     """Test cases for User model."""
 
-    def test_user_creation(self, db_session: Session):
-        """Test creating a new user."""
-        user_data = {
-            "email": "test@example.com",
-            "hashed_password": "hashed_password",
-            "display_name": "Test User",
-            "first_name": "Test",
-            "last_name": "User",
-            "role": "student",
-            "is_active": True
-        }
-
-        user = User(**user_data)
-        db_session.add(user)
-        db_session.commit()
-        db_session.refresh(user)
-
-        assert user.id is not None
-        assert user.email == "test@example.com"
-        assert user.display_name == "Test User"
-        assert user.role == "student"
-        assert user.is_active is True
-        assert user.created_at is not None
-
     def test_user_unique_email(self, db_session: Session):
         """Test that email must be unique."""
         user1_data = {
             "email": "duplicate@example.com",
-            "hashed_password": "password1",
+            "hashed_password": TEST_HASHED_PASSWORD,
             "display_name": "User 1",
-            "first_name": "User",
-            "last_name": "One",
             "role": "student",
             "is_active": True
         }
 
         user2_data = {
             "email": "duplicate@example.com",  # Same email
-            "hashed_password": "password2",
+            "hashed_password": TEST_HASHED_PASSWORD,
             "display_name": "User 2",
-            "first_name": "User",
-            "last_name": "Two",
             "role": "student",
             "is_active": True
         }
@@ -72,60 +186,63 @@ class TestUserModel:
         with pytest.raises(Exception):  # Should raise IntegrityError
             db_session.commit()
 
-    def test_user_default_values(self, db_session: Session):
-        """Test default values for user fields."""
-        user_data = {
-            "email": "defaults@example.com",
-            "hashed_password": "password",
-            "display_name": "Default User"
-        }
-
-        user = User(**user_data)
-        db_session.add(user)
-        db_session.commit()
-        db_session.refresh(user)
-
-        assert user.role == "student"  # Default role
-        assert user.is_active is True  # Default active status
-        assert user.first_name == ""  # Default empty string
-        assert user.last_name == ""  # Default empty string
-
     def test_user_relationships(self, db_session: Session):
         """Test user relationships with other models."""
         user = User(
             email="relations@example.com",
-            hashed_password="password",
+            hashed_password=TEST_HASHED_PASSWORD,
             display_name="Relation User"
         )
+        # Flush (not commit) between parents and children so the foreign
+        # keys are known while everything stays in one transaction
         db_session.add(user)
-        db_session.commit()
+        db_session.flush()
 
-        # Test documents relationship
-        document = Document(
+        upload = Upload(
+            user_id=user.id,
             filename="test.pdf",
-            content_type="application/pdf",
-            size=1024,
-            user_id=user.id
+            filepath="uploads/test.pdf",
+            file_type="pdf",
+            file_size=1024
         )
-        db_session.add(document)
-        db_session.commit()
+        db_session.add(upload)
+        db_session.flush()
 
-        # Refresh user to load relationships
-        db_session.refresh(user)
-        assert len(user.documents) == 1
-        assert user.documents[0].filename == "test.pdf"
+        document = Document(
+            upload_id=upload.id,
+            title="Test Document",
+            content_summary="Summary"
+        )
+        db_session.add(document)
+        db_session.flush()
 
-        # Test flashcards relationship
         flashcard = Flashcard(
             question="What is 2+2?",
             answer="4",
+            source="{}",
             user_id=user.id,
             document_id=document.id
         )
         db_session.add(flashcard)
         db_session.commit()
 
-        db_session.refresh(user)
+        # Load the collections up front; raiseload catches any other lazy load
+        user = db_session.execute(
+            select(User)
+            .options(
+                selectinload(User.uploads).selectinload(Upload.documents),
+                selectinload(User.flashcards),
+                raiseload("*")
+            )
+            .where(User.id == user.id)
+        ).scalar_one()
+
+        # Test uploads relationship, and the documents parsed from them
+        assert len(user.uploads) == 1
+        assert user.uploads[0].filename == "test.pdf"
+        assert [d.title for d in user.uploads[0].documents] == ["Test Document"]
+
+        # Test flashcards relationship
         assert len(user.flashcards) == 1
         assert user.flashcards[0].question == "What is 2+2?"
 
@@ -133,119 +250,98 @@ class TestUserModel:
 class TestDocumentModel:
     """Test cases for Document model."""
 
-    def test_document_creation(self, db_session: Session):
-        """Test creating a new document."""
-        user = User(
-            email="docuser@example.com",
-            hashed_password="password",
-            display_name="Doc User"
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        doc_data = {
-            "filename": "test_document.pdf",
-            "content_type": "application/pdf",
-            "size": 2048000,  # 2MB
-            "user_id": user.id
-        }
-
-        document = Document(**doc_data)
-        db_session.add(document)
-        db_session.commit()
-        db_session.refresh(document)
-
-        assert document.id is not None
-        assert document.filename == "test_document.pdf"
-        assert document.content_type == "application/pdf"
-        assert document.size == 2048000
-        assert document.user_id == user.id
-        assert document.created_at is not None
-
-    def test_document_user_relationship(self, db_session: Session):
-        """Test document-user relationship."""
-        user = User(
-            email="docrel@example.com",
-            hashed_password="password",
-            display_name="Doc Rel User"
+    def test_document_upload_relationship(self, db_session: Session, sample_user: User):
+        """Test document-upload relationship."""
+        upload = Upload(
+            user_id=sample_user.id,
+            filename="relationship_test.pdf",
+            filepath="uploads/relationship_test.pdf",
+            file_type="pdf",
+            file_size=1024
         )
-        db_session.add(user)
+        db_session.add(upload)
+        db_session.flush()
 
         document = Document(
-            filename="relationship_test.pdf",
-            content_type="application/pdf",
-            size=1024,
-            user_id=user.id
+            upload_id=upload.id,
+            title="Relationship Test",
+            content_summary="Summary"
         )
         db_session.add(document)
         db_session.commit()
 
         # Test reverse relationship
-        db_session.refresh(user)
-        assert len(user.documents) == 1
-        assert user.documents[0].id == document.id
+        db_session.refresh(upload)
+        assert len(upload.documents) == 1
+        assert upload.documents[0].id == document.id
+        assert document.upload.user_id == sample_user.id
 
 
 class TestFlashcardModel:
     """Test cases for Flashcard model."""
 
-    def test_flashcard_creation(self, db_session: Session):
+    def test_flashcard_creation(self, db_session: Session, sample_user: User, sample_upload: Upload):
         """Test creating a new flashcard."""
-        user = User(
-            email="flashuser@example.com",
-            hashed_password="password",
-            display_name="Flash User"
-        )
-        db_session.add(user)
-
         document = Document(
-            filename="flash_doc.pdf",
-            content_type="application/pdf",
-            size=1024,
-            user_id=user.id
+            upload_id=sample_upload.id,
+            title="Flash Document",
+            content_summary="Summary"
         )
         db_session.add(document)
-        db_session.commit()
+        db_session.flush()
 
         flashcard_data = {
             "question": "What is the capital of France?",
             "answer": "Paris",
-            "user_id": user.id,
+            "source": '{"document_id": %d}' % document.id,
+            "user_id": sample_user.id,
             "document_id": document.id
         }
 
         flashcard = Flashcard(**flashcard_data)
         db_session.add(flashcard)
-        db_session.commit()
-        db_session.refresh(flashcard)
+        db_session.flush()
 
         assert flashcard.id is not None
         assert flashcard.question == "What is the capital of France?"
         assert flashcard.answer == "Paris"
-        assert flashcard.user_id == user.id
+        assert flashcard.user_id == sample_user.id
         assert flashcard.document_id == document.id
+        assert flashcard.difficulty == "medium"
         assert flashcard.created_at is not None
 
     def test_flashcard_relationships(self, db_session: Session):
         """Test flashcard relationships."""
         user = User(
             email="flashrel@example.com",
-            hashed_password="password",
+            hashed_password=TEST_HASHED_PASSWORD,
             display_name="Flash Rel User"
         )
         db_session.add(user)
+        db_session.flush()
 
-        document = Document(
+        upload = Upload(
+            user_id=user.id,
             filename="flash_rel.pdf",
-            content_type="application/pdf",
-            size=1024,
-            user_id=user.id
+            filepath="uploads/flash_rel.pdf",
+            file_type="pdf",
+            file_size=1024
+        )
+        db_session.add(upload)
+        db_session.flush()
+
+        document = Document(
+            upload_id=upload.id,
+            title="Flash Rel Document",
+            content_summary="Summary"
         )
         db_session.add(document)
+        db_session.flush()
 
         flashcard = Flashcard(
             question="Test question",
             answer="Test answer",
+            source="{}",
             user_id=user.id,
             document_id=document.id
         )
@@ -261,85 +357,21 @@ class TestFlashcardModel:
         assert len(document.flashcards) == 1
 
 
-class TestDeadlineModel:
-    """Test cases for Deadline model."""
-
-    def test_deadline_creation(self, db_session: Session):
-        """Test creating a new deadline."""
-        user = User(
-            email="deadline@example.com",
-            hashed_password="password",
-            display_name="Deadline User"
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        deadline_data = {
-            "title": "Submit Assignment",
-            "description": "Submit the final project",
-            "due_date": "2024-12-31T23:59:59Z",
-            "priority": "high",
-            "user_id": user.id
-        }
-
-        deadline = Deadline(**deadline_data)
-        db_session.add(deadline)
-        db_session.commit()
-        db_session.refresh(deadline)
-
-        assert deadline.id is not None
-        assert deadline.title == "Submit Assignment"
-        assert deadline.description == "Submit the final project"
-        assert deadline.priority == "high"
-        assert deadline.user_id == user.id
-        assert deadline.created_at is not None
-
-    def test_deadline_default_values(self, db_session: Session):
-        """Test default values for deadline."""
-        user = User(
-            email="deaddef@example.com",
-            hashed_password="password",
-            display_name="Dead Def User"
-        )
-        db_session.add(user)
-        db_session.commit()
-
-        deadline = Deadline(
-            title="Test Deadline",
-            due_date="2024-12-31T23:59:59Z",
-            user_id=user.id
-        )
-        db_session.add(deadline)
-        db_session.commit()
-        db_session.refresh(deadline)
-
-        assert deadline.description == ""  # Default empty description
-        assert deadline.priority == "medium"  # Default priority
-        assert deadline.is_completed is False  # Default completion status
-
-
 class TestMatchModel:
     """Test cases for Match model."""
 
-    def test_match_creation(self, db_session: Session):
+    def test_match_creation(self, db_session: Session, sample_user: User):
         """Test creating a new match."""
-        user1 = User(
-            email="user1@example.com",
-            hashed_password="password",
-            display_name="User One"
-        )
-        db_session.add(user1)
-
         user2 = User(
             email="user2@example.com",
-            hashed_password="password",
+            hashed_password=TEST_HASHED_PASSWORD,
             display_name="User Two"
         )
         db_session.add(user2)
         db_session.commit()
 
         match_data = {
-            "user_id": user1.id,
+            "user_id": sample_user.id,
             "matched_user_id": user2.id,
             "score": 0.85,
             "reason": "Similar interests in Computer Science"
@@ -347,55 +379,11 @@ class TestMatchModel:
 
         match = Match(**match_data)
         db_session.add(match)
-        db_session.commit()
-        db_session.refresh(match)
+        db_session.flush()
 
         assert match.id is not None
-        assert match.user_id == user1.id
+        assert match.user_id == sample_user.id
         assert match.matched_user_id == user2.id
         assert match.score == 0.85
         assert match.reason == "Similar interests in Computer Science"
-        assert match.created_at is not None
-
-
-class TestOpportunityModel:
-    """Test cases for Opportunity model."""
-
-    def test_opportunity_creation(self, db_session: Session):
-        """Test creating a new opportunity."""
-        opportunity_data = {
-            "title": "Software Engineering Internship",
-            "description": "Great opportunity for students",
-            "source": "LinkedIn",
-            "url": "https://example.com/job",
-            "tags": "internship,software,engineering",
-            "deadline": "2024-12-31T23:59:59Z"
-        }
-
-        opportunity = Opportunity(**opportunity_data)
-        db_session.add(opportunity)
-        db_session.commit()
-        db_session.refresh(opportunity)
-
-        assert opportunity.id is not None
-        assert opportunity.title == "Software Engineering Internship"
-        assert opportunity.description == "Great opportunity for students"
-        assert opportunity.source == "LinkedIn"
-        assert opportunity.url == "https://example.com/job"
-        assert opportunity.tags == "internship,software,engineering"
-        assert opportunity.created_at is not None
-
-    def test_opportunity_defaults(self, db_session: Session):
-        """Test default values for opportunity."""
-        opportunity = Opportunity(
-            title="Test Opportunity",
-            description="Test description",
-            source="Test Source"
-        )
-        db_session.add(opportunity)
-        db_session.commit()
-        db_session.refresh(opportunity)
-
-        assert opportunity.url == ""  # Default empty URL
-        assert opportunity.tags == ""  # Default empty tags
-        assert opportunity.is_active is True  # Default active status
\ No newline at end of file
+        assert match.created_at is not None
\ No newline at end of file
@@ -8,8 +8,12 @@ import os
 import sys
 import subprocess
 import platform
+import shutil
 from pathlib import Path
 
+# The platform can't change while we run, so check it once
+IS_WINDOWS = platform.system() == "Windows"
+
 
 class LocalRunner:
     """Local development runner for Studagent."""
@@ -18,31 +22,57 @@ class LocalRunner:
         self.project_root = Path(__file__).parent
         self.backend_dir = self.project_root / "backend"
         self.venv_dir = self.backend_dir / "venv"
-        self.is_windows = platform.system() == "Windows"
+        self.is_windows = IS_WINDOWS
 
-    def get_venv_python(self):
-        """Get the path to the virtual environment Python executable."""
+        # Executable paths never change for a run, so resolve them once
         if self.is_windows:
-            return self.venv_dir / "Scripts" / "python.exe"
+            self._venv_python = self.venv_dir / "Scripts" / "python.exe"
+            self._venv_uvicorn = self.venv_dir / "Scripts" / "uvicorn.exe"
         else:
-            return self.venv_dir / "bin" / "python"
+            self._venv_python = self.venv_dir / "bin" / "python"
+            self._venv_uvicorn = self.venv_dir / "bin" / "uvicorn"
+        self._venv_exists = None
+
+        # Command name -> handler
+        self._commands = {
+            "backend": self.start_backend,
+            "test": self.run_tests,
+            "test-fast": lambda: self.run_tests(["-m", "not slow"]),
+            "seed": self.seed_database,
+            "redis": self.check_redis,
+            "help": self.show_help,
+        }
+
+    def get_venv_python(self):
+        """Get the path to the virtual environment Python executable."""
+        return self._venv_python
 
     def get_venv_uvicorn(self):
         """Get the path to the virtual environment uvicorn executable."""
-        if self.is_windows:
-            return self.venv_dir / "Scripts" / "uvicorn.exe"
-        else:
-            return self.venv_dir / "bin" / "uvicorn"
+        return self._venv_uvicorn
 
     def check_venv(self):
         """Check if virtual environment exists and is activated."""
-        venv_python = self.get_venv_python()
-        if not venv_python.exists():
+        if self._venv_exists is None:
+            self._venv_exists = self._venv_python.exists()
+        if not self._venv_exists:
             print("❌ Virtual environment not found!")
             print("Please run: python setup.py")
             return False
         return True
 
+    def _exec_if_supported(self, command):
+        """
+        Replace this process with `command` when nothing needs to run after it.
+
+        Returns only on Windows, where os.exec* starts a new process instead of
+        replacing this one; callers then run `command` as a child process.
+        """
+        if self.is_windows:
+            return
+        sys.stdout.flush()
+        os.execv(command[0], command)
+
     def start_backend(self):
         """Start the FastAPI backend server."""
         if not self.check_venv():
@@ -57,20 +87,23 @@ class LocalRunner:
         uvicorn_path = self.get_venv_uvicorn()
         os.chdir(self.backend_dir)
 
+        command = [
+            str(uvicorn_path),
+            "app.main:app",
+            "--reload",
+            "--host", "0.0.0.0",
+            "--port", "8000"
+        ]
+        self._exec_if_supported(command)
+
         try:
-            subprocess.run([
-                str(uvicorn_path),
-                "app.main:app",
-                "--reload",
-                "--host", "0.0.0.0",
-                "--port", "8000"
-            ], check=True)
+            subprocess.run(command, check=True)
         except KeyboardInterrupt:
             print("\n👋 Backend server stopped")
         except subprocess.CalledProcessError as e:
             print(f"❌ Failed to start backend: {e}")
 
-    def run_tests(self):
+    def run_tests(self, extra_args=None):
         """Run the test suite."""
         if not self.check_venv():
             return
@@ -79,11 +112,14 @@ class LocalRunner:
         venv_python = self.get_venv_python()
         os.chdir(self.backend_dir)
 
+        command = [
+            str(venv_python), "-m", "pytest",
+            "tests/", "-v", "--tb=short"
+        ] + (extra_args or [])
+        self._exec_if_supported(command)
+
         try:
-            subprocess.run([
-                str(venv_python), "-m", "pytest",
-                "tests/", "-v", "--tb=short"
-            ], check=True)
+            subprocess.run(command, check=True)
         except subprocess.CalledProcessError as e:
             print(f"❌ Tests failed: {e}")
 
@@ -98,7 +134,8 @@ class LocalRunner:
         try:
             subprocess.run([
                 str(venv_python),
-                str(self.backend_dir / "scripts" / "seed_data.py")
+                str(self.backend_dir / "scripts" / "seed_data.py"),
+                "--create-tables"
             ], check=True)
             print("✅ Database seeded successfully!")
         except subprocess.CalledProcessError as e:
@@ -106,18 +143,20 @@ class LocalRunner:
 
     def check_redis(self):
         """Check if Redis is running."""
-        try:
-            result = subprocess.run(
-                ["redis-cli", "ping"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0 and "PONG" in result.stdout:
-                print("✅ Redis is running")
-                return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+        # Only ping when the client is installed
+        if shutil.which("redis-cli"):
+            try:
+                result = subprocess.run(
+                    ["redis-cli", "ping"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5
+                )
+                if result.returncode == 0 and "PONG" in result.stdout:
+                    print("✅ Redis is running")
+                    return True
+            except subprocess.TimeoutExpired:
+                pass
 
         print("⚠️  Redis is not running")
         print("To start Redis:")
@@ -138,6 +177,7 @@ class LocalRunner:
         print("Available commands:")
         print("  python run_local.py backend    - Start the backend server")
         print("  python run_local.py test       - Run the test suite")
+        print("  python run_local.py test-fast  - Run the tests not marked slow")
         print("  python run_local.py seed       - Seed database with sample data")
         print("  python run_local.py redis      - Check Redis status")
         print("  python run_local.py help       - Show this help")
@@ -159,19 +199,12 @@ class LocalRunner:
 
         command = sys.argv[1].lower()
 
-        if command == "backend":
-            self.start_backend()
-        elif command == "test":
-            self.run_tests()
-        elif command == "seed":
-            self.seed_database()
-        elif command == "redis":
-            self.check_redis()
-        elif command == "help":
-            self.show_help()
-        else:
+        handler = self._commands.get(command)
+        if handler is None:
             print(f"❌ Unknown command: {command}")
             self.show_help()
+            return
+        handler()
 
 
 if __name__ == "__main__":
@@ -11,6 +11,12 @@ import platform
 import shutil
 from pathlib import Path
 
+# The platform can't change while we run, so check it once
+IS_WINDOWS = platform.system() == "Windows"
+
+# Downloaded and built wheels are kept here so re-running setup reuses them
+PIP_CACHE_DIR = Path.home() / ".cache" / "studagent-pip"
+
 
 class StudagentSetup:
     """Setup class for Studagent local development environment."""
@@ -19,7 +25,7 @@ class StudagentSetup:
         self.project_root = Path(__file__).parent
         self.backend_dir = self.project_root / "backend"
         self.venv_dir = self.backend_dir / "venv"
-        self.is_windows = platform.system() == "Windows"
+        self.is_windows = IS_WINDOWS
 
     def print_header(self, text):
         """Print a formatted header."""
@@ -31,21 +37,28 @@ class StudagentSetup:
         """Print a formatted step."""
         print(f"\n[{step_num}] {text}")
 
-    def run_command(self, command, cwd=None, shell=False):
-        """Run a command and return the result."""
+    def run_command(self, command, cwd=None, shell=False, env=None, stream=False):
+        """
+        Run a command and return the result.
+
+        With stream=True the output goes straight to the terminal instead of
+        being captured, and an empty string is returned on success.
+        """
         try:
             result = subprocess.run(
                 command,
                 cwd=cwd or self.project_root,
                 shell=shell,
-                capture_output=True,
+                env={**os.environ, **env} if env else None,
+                capture_output=not stream,
                 text=True,
                 check=True
             )
-            return result.stdout.strip()
+            return "" if stream else result.stdout.strip()
         except subprocess.CalledProcessError as e:
             print(f"❌ Command failed: {command}")
-            print(f"Error: {e.stderr}")
+            if not stream:
+                print(f"Error: {e.stderr}")
             return None
 
     def check_python_version(self):
@@ -62,13 +75,10 @@ class StudagentSetup:
     def check_git(self):
         """Check if Git is installed."""
         self.print_step("2", "Checking Git installation...")
-        try:
-            result = self.run_command(["git", "--version"])
-            if result:
-                print(f"✅ {result}")
-                return True
-        except:
-            pass
+        git_path = shutil.which("git")
+        if git_path:
+            print(f"✅ Git found at {git_path}")
+            return True
         print("❌ Git not found. Please install Git first.")
         return False
 
@@ -86,7 +96,7 @@ class StudagentSetup:
                 return True
 
         try:
-            self.run_command([sys.executable, "-m", "venv", str(self.venv_dir)])
+            self.run_command([sys.executable, "-m", "venv", str(self.venv_dir)], stream=True)
             print(f"✅ Virtual environment created at {self.venv_dir}")
             return True
         except Exception as e:
@@ -105,16 +115,24 @@ class StudagentSetup:
             activate_script = self.venv_dir / "bin" / "activate"
             pip_cmd = [str(self.venv_dir / "bin" / "pip")]
 
+        pip_env = {"PIP_CACHE_DIR": str(PIP_CACHE_DIR)}
+
         # Upgrade pip first
         try:
-            self.run_command(pip_cmd + ["install", "--upgrade", "pip"], cwd=self.backend_dir)
+            self.run_command(pip_cmd + ["install", "--upgrade", "pip"], cwd=self.backend_dir, env=pip_env, stream=True)
             print("✅ Pip upgraded successfully")
         except:
             print("⚠️  Could not upgrade pip, continuing...")
 
-        # Install requirements
+        # Install requirements; prefer wheels over sdist builds and skip
+        # byte-compiling, Python compiles modules on first import anyway
         try:
-            self.run_command(pip_cmd + ["install", "-r", "requirements.txt"], cwd=self.backend_dir)
+            self.run_command(
+                pip_cmd + ["install", "--prefer-binary", "--no-compile", "-r", "requirements.txt"],
+                cwd=self.backend_dir,
+                env=pip_env,
+                stream=True
+            )
             print("✅ All dependencies installed successfully")
             return True
         except Exception as e:
@@ -135,7 +153,7 @@ class StudagentSetup:
                 else:
                     python_cmd = str(self.venv_dir / "bin" / "python")
 
-                self.run_command([python_cmd, str(seed_script)], cwd=self.backend_dir)
+                self.run_command([python_cmd, str(seed_script), "--create-tables"], cwd=self.backend_dir, stream=True)
                 print("✅ Database seeded with sample data")
                 return True
             except Exception as e:
@@ -149,13 +167,12 @@ class StudagentSetup:
         """Check Redis installation and provide setup instructions."""
         self.print_step("6", "Checking Redis setup...")
 
-        try:
+        # Only ping when the client is installed
+        if shutil.which("redis-cli"):
             result = self.run_command(["redis-cli", "ping"])
-            if "PONG" in result:
+            if result and "PONG" in result:
                 print("✅ Redis is running and accessible")
                 return True
-        except:
-            pass
 
         print("⚠️  Redis not found or not running")
         print("\nTo install and run Redis:")